@@ -4,19 +4,31 @@ CollecTF Selenium Downloader
 Uses Selenium to actually click links and navigate like a real browser
 """
 
+import argparse
+import atexit
 import contextlib
+import copy
+import cProfile
 import hashlib
+import itertools
 import json
 import logging
+import multiprocessing
+import os
+import queue
 import re
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import urlsplit
 
 try:
     from selenium import webdriver
-    from selenium.common.exceptions import NoSuchElementException
+    from selenium.common.exceptions import NoSuchElementException, TimeoutException
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.support.ui import WebDriverWait
 except ImportError:
     print("❌ Selenium not installed. Please install with: pip install selenium")
@@ -26,15 +38,159 @@ except ImportError:
     )
     exit(1)
 
+try:
+    import lxml.html
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    print("❌ requests/lxml not installed. Please install with: pip install requests lxml")
+    exit(1)
+
+# orjson is optional; fall back to the standard library json module without it
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# watchdog is optional; without it downloads are detected by polling the download dir
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Patterns used on every motif report
+VIEW_LINK_RE = re.compile(r"/view_motif_reports_by_TF_and_species/(\d+)/(\d+)/")
+PRE_RE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
+FASTA_RE = re.compile(r"(>[^\n]+\n(?:[0-9\t\s]+\n?)+)", re.MULTILINE)
+SAFE_NAME_RE = re.compile(r"[^\w\-_]")
+
+
+class _DownloadEventHandler:
+    """Queue files that finish downloading, as reported by a watchdog observer"""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def dispatch(self, event):
+        if event.is_directory:
+            return
+
+        # Chrome writes to a .crdownload file and renames it once the download is done
+        if event.event_type == "moved":
+            path = event.dest_path
+        elif event.event_type == "closed":
+            path = event.src_path
+        else:
+            return
+
+        if not path.endswith(".crdownload"):
+            self.queue.put(path)
+
 
 class CollecTFSeleniumDownloader:
-    def __init__(self, output_dir="data/tf_coevolution/collectf/selenium_psfms", headless=False):
+    # Elements that only appear once each page type has loaded
+    TF_FAMILIES_PAGE_READY = (By.XPATH, "//a[contains(@href, 'view_motif_reports_by_TF')]")
+    SPECIES_PAGE_READY = (
+        By.XPATH,
+        "//tr[.//a[contains(@href, 'view_motif_reports_by_TF_and_species')]]",
+    )
+    MOTIF_PAGE_READY = (By.XPATH, "//input[@name='csrfmiddlewaretoken'] | //table")
+
+    # Returns [cell, index] for the first of arguments[0] found in a td's own text, like
+    # XPath's td[contains(text(), ...)], so layout cells merely wrapping it never match
+    FIND_TEXT_CELL_JS = """
+        const cells = [...document.querySelectorAll('td')];
+        for (const [i, text] of arguments[0].entries()) {
+            const cell = cells.find(td => [...td.childNodes].some(
+                n => n.nodeType === Node.TEXT_NODE && n.data.includes(text)
+            ));
+            if (cell) return [cell, i];
+        }
+        return [null, -1];
+    """
+
+    # Markers in a motif report page's HTML that show whether it can be exported
+    EXPORT_INDICATORS = ["Export data", "PSFM", "site_id", "csrfmiddlewaretoken", "Download PSFM"]
+
+    # Resources blocked at the network layer; none of them are needed for the exports
+    BLOCKED_URL_PATTERNS = [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.svg",
+        "*.woff*",
+        "*.ttf",
+        "*.css",
+        "*google-analytics*",
+        "*googletagmanager*",
+    ]
+
+    # Navigation words whose links are never TF families
+    _SKIP_WORDS = frozenset(
+        {
+            "browse",
+            "search",
+            "about",
+            "home",
+            "view",
+            "more",
+            "here",
+            "feedback",
+            "stats",
+            "links",
+            "cite",
+            "contribute",
+            "compare",
+            "register",
+            "login",
+            "quick",
+            "help",
+            "contact",
+        }
+    )
+
+    # TF-like link names (alphanumeric, reasonable length) that are not navigation words
+    _TF_LINK_RE = re.compile(
+        rf"^(?!(?:{'|'.join(sorted(_SKIP_WORDS))})$)[A-Za-z][A-Za-z0-9/]{{1,15}}$",
+        re.IGNORECASE,
+    )
+
+    # Number of progress updates to batch before writing the completed TFs file
+    PROGRESS_FLUSH_INTERVAL = 25
+
+    # Seconds before a cached list of species hrefs is fetched again
+    HREF_CACHE_TTL = 7 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        output_dir="data/tf_coevolution/collectf/selenium_psfms",
+        headless=True,
+        worker_id=None,
+        download_timeout=30,
+        species_workers=1,
+        start_browser=True,
+    ):
         self.base_url = "http://www.collectf.org"
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.headless = headless
+
+        # Parallel workers get their own download dir and progress files
+        self.worker_id = worker_id
+        suffix = "" if worker_id is None else f"_{worker_id}"
 
         # Create subdirectories
         self.matrices_dir = self.output_dir / "matrices"
@@ -44,23 +200,96 @@ class CollecTFSeleniumDownloader:
         for dir_path in [self.matrices_dir, self.metadata_dir, self.progress_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
-        # Progress tracking files
-        self.progress_file = self.progress_dir / "download_progress.json"
-        self.completed_file = self.progress_dir / "completed_tfs.txt"
-        self.family_log_file = self.progress_dir / "tf_family_results.txt"
+        # Metadata for every PSFM goes to one JSON Lines file shared by all workers;
+        # each record is a single unbuffered O_APPEND write, so lines never interleave
+        self.metadata_file = self.metadata_dir / "all.jsonl"
+        self._metadata_fp = open(self.metadata_file, "ab", buffering=0)
 
-        # Setup Chrome options with download directory
+        # Progress tracking files
+        self.progress_file = self.progress_dir / f"download_progress{suffix}.json"
+        self.progress_log_file = self.progress_dir / f"download_progress{suffix}.jsonl"
+        self.completed_file = self.progress_dir / f"completed_tfs{suffix}.txt"
+        self.family_log_file = self.progress_dir / f"tf_family_results{suffix}.txt"
+
+        # Species hrefs per TF family, reused across runs until they expire
+        self.href_cache_file = self.progress_dir / f"href_cache{suffix}.json"
+        self._href_cache = self._read_json_file(self.progress_dir / "href_cache.json")
+        self._href_cache_updates = {}
+        if worker_id is not None:
+            self._href_cache_updates = self._read_json_file(self.href_cache_file)
+            self._href_cache.update(self._href_cache_updates)
+
+        # Progress is a JSON snapshot plus an append-only journal of later updates,
+        # compacted back into the snapshot at startup and on close
+        self._progress = self._load_progress_files(self.progress_file, self.progress_log_file)
+        self._progress_log = None
+        if self.progress_log_file.exists():
+            self._compact_progress()
+        self._unflushed_updates = 0
+        self._completed = set()
+        self._unflushed_completed = []
+        atexit.register(self._flush_progress)
+
+        # Set up download directory inside matrices_dir, so finished PSFMs are only renamed
+        # into their final place within the same directory tree
+        self.download_dir = self.matrices_dir / f"incoming{suffix}"
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.download_timeout = download_timeout
+
+        # Optional pool of extra browsers for downloading a family's motif reports in parallel
+        self.species_workers = species_workers
+        self._species_executor = None
+        self._species_local = threading.local()
+        self._species_clones = []
+        self._species_lock = threading.Lock()
+        self._species_clone_ids = itertools.count()
+
+        # Static list pages and PSFMs are fetched over plain HTTP on one keep-alive session;
+        # browser cookies are copied into it whenever the browser moves to a new origin
+        self.http = self._build_http_session()
+        self._http_cookie_origin = None
+
+        # A coordinator of worker processes only starts a browser if it needs one itself
+        self.driver = None
+        self._download_observer = None
+        self._download_events = None
+        if start_browser:
+            try:
+                self._ensure_browser()
+            except Exception:
+                # Don't leave the metadata file and exit hook of a half-built instance behind
+                self._metadata_fp.close()
+                atexit.unregister(self._flush_progress)
+                raise
+
+    def _ensure_browser(self):
+        """Start watching downloads and the Chrome WebDriver if they aren't running yet"""
+        if self.driver is None:
+            self._start_download_observer()
+            try:
+                self._start_driver()
+            except Exception:
+                self._stop_download_observer()
+                raise
+
+    def _build_http_session(self):
+        """Create a pooled requests session with retries, reused for every HTTP fetch"""
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _build_chrome_options(self):
+        """Build Chrome options with the download directory for this instance"""
         chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
 
-        # Set up download directory
-        self.download_dir = self.output_dir / "temp_downloads"
-        self.download_dir.mkdir(parents=True, exist_ok=True)
-
         prefs = {
             "download.default_directory": str(self.download_dir.absolute()),
             "download.prompt_for_download": False,
@@ -70,6 +299,13 @@ class CollecTFSeleniumDownloader:
             "profile.default_content_setting_values.automatic_downloads": 1,
             "profile.default_content_settings.popups": 0,
             "profile.managed_default_content_settings.images": 2,
+            # Only the download links matter, so skip everything used for rendering
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.geolocation": 2,
+            "profile.managed_default_content_settings.notifications": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
             # More aggressive insecure download settings
             "profile.default_content_setting_values.mixed_script": 1,
             "profile.default_content_setting_values.media_stream": 1,
@@ -104,9 +340,40 @@ class CollecTFSeleniumDownloader:
             "--unsafely-treat-insecure-origin-as-secure=http://www.collectf.org"
         )
 
-        # Initialize the driver
+        # Return from get() on DOMContentLoaded; explicit waits cover the elements we need
+        chrome_options.page_load_strategy = "eager"
+
+        return chrome_options
+
+    def _start_download_observer(self):
+        """Watch the download dir for finished downloads if watchdog is available"""
+        self._download_observer = None
+        self._download_events = None
+        if Observer is None:
+            return
+
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            handler = _DownloadEventHandler()
+            observer = Observer()
+            observer.schedule(handler, str(self.download_dir))
+            observer.start()
+            self._download_observer = observer
+            self._download_events = handler.queue
+        except Exception as e:
+            logger.warning(f"Could not watch download dir, falling back to polling: {e}")
+
+    def _stop_download_observer(self):
+        """Stop the download dir watcher, if one is running"""
+        if self._download_observer is not None:
+            self._download_observer.stop()
+            self._download_observer.join(timeout=5)
+            self._download_observer = None
+            self._download_events = None
+
+    def _start_driver(self):
+        """Initialize the Chrome WebDriver"""
+        try:
+            self.driver = webdriver.Chrome(options=self._build_chrome_options())
             self.wait = WebDriverWait(self.driver, 10)
             logger.info("✓ Chrome WebDriver initialized successfully")
         except Exception as e:
@@ -114,172 +381,245 @@ class CollecTFSeleniumDownloader:
             logger.error("Make sure ChromeDriver is installed and in your PATH")
             raise
 
-    def _find_link_by_text(self, text):
-        """Helper method to find a link by text, handling stale elements"""
+        # The image/CSS prefs and flags are not always honoured, so block at the network layer
         try:
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
-            for link in all_links:
-                try:
-                    if link.text.strip() == text:
-                        return link
-                except Exception:
-                    continue
-            return None
-        except Exception:
-            return None
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS}
+            )
+        except Exception as e:
+            logger.warning(f"Could not block resource URLs via CDP: {e}")
 
-    def _get_current_tf_links(self):
-        """Get fresh TF links from the current page"""
+    def _wait_for(self, locator, description="page content"):
+        """Wait until an element marking the loaded page is present"""
         try:
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
-            tf_links = []
+            self.wait.until(EC.presence_of_element_located(locator))
+            return True
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for {description}")
+            return False
 
-            for link in all_links:
-                try:
-                    text = link.text.strip()
-                    href = link.get_attribute("href")
-
-                    # Skip empty or very short names
-                    if len(text) < 2 or len(text) > 20:
-                        continue
-
-                    # Skip common navigation words
-                    skip_words = {
-                        "browse",
-                        "search",
-                        "about",
-                        "home",
-                        "view",
-                        "more",
-                        "here",
-                        "feedback",
-                        "stats",
-                        "links",
-                        "cite",
-                        "contribute",
-                        "compare",
-                        "register",
-                        "login",
-                        "quick",
-                        "help",
-                        "contact",
-                    }
-                    if text.lower() in skip_words:
-                        continue
+    def _extract_tf_links(self, links):
+        """Filter (text, href) pairs down to TF family links"""
+        match = self._TF_LINK_RE.match
+        return [{"name": text, "href": href} for text, href in links if href and match(text)]
+
+    def _all_links_js(self):
+        """Return [text, href] for every link on the page in one round trip"""
+        return self.driver.execute_script(
+            "const r = []; "
+            "for (const a of document.querySelectorAll('a')) r.push([a.innerText.trim(), a.href]); "
+            "return r;"
+        )
+
+    def _extract_tf_links_from_dom(self):
+        """Get TF family links from the page open in the browser"""
+        try:
+            return self._extract_tf_links(self._all_links_js())
+        except Exception as e:
+            logger.error(f"Error getting current TF links: {e}")
+            return []
 
-                    # Look for TF-like names (alphanumeric, reasonable length)
-                    if re.match(r"^[A-Za-z][A-Za-z0-9/]{1,15}$", text):
-                        tf_links.append({"name": text, "element": link, "href": href})
+    def _fetch_html(self, url):
+        """Fetch a static page over HTTP and parse it with absolute links"""
+        response = self.http.get(url, timeout=30)
+        response.raise_for_status()
+        tree = lxml.html.fromstring(response.content)
+        tree.make_links_absolute(response.url)
+        return tree
 
-                except Exception:
-                    continue  # Skip problematic links
+    def fetch_tf_family_links(self):
+        """Step 1: Fetch TF family names and links from the TF families page"""
+        tf_families_url = f"{self.base_url}/browse/browse_by_TF/"
+        logger.info(f"Step 1: Fetching TF families page: {tf_families_url}")
+
+        try:
+            tree = self._fetch_html(tf_families_url)
+            tf_links = self._extract_tf_links(
+                (link.text_content().strip(), link.get("href")) for link in tree.iter("a")
+            )
+            # An empty list is more likely a block or error page than a site without TFs
+            if tf_links:
+                return tf_links
+            logger.warning("No TF family links found over HTTP, using browser")
 
-            return tf_links
         except Exception as e:
-            logger.error(f"Error getting current TF links: {e}")
+            logger.warning(f"Could not fetch TF families page over HTTP ({e}), using browser")
+
+        self._ensure_browser()
+        if not self.navigate_to_tf_families_page():
             return []
+        return self._extract_tf_links_from_dom()
+
+    @staticmethod
+    def _read_json_file(path):
+        """Read a JSON file, or return an empty dict if it is missing or unreadable"""
+        if not path.exists():
+            return {}
+        try:
+            return _loads(path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Could not load {path.name}: {e}")
+            return {}
+
+    @classmethod
+    def _load_progress_files(cls, snapshot_file, log_file):
+        """Load a progress snapshot and replay its journal on top of it"""
+        progress = cls._read_json_file(snapshot_file)
+        if not log_file.exists():
+            return progress
+        try:
+            with open(log_file, "rb") as f:
+                for line in f:
+                    try:
+                        cls._apply_progress_record(progress, _loads(line))
+                    except Exception as e:
+                        # Most likely a partial last line from an interrupted run
+                        logger.warning(f"Skipping bad record in {log_file.name}: {e}")
+        except Exception as e:
+            logger.warning(f"Could not load {log_file.name}: {e}")
+        return progress
+
+    @staticmethod
+    def _apply_progress_record(progress, record):
+        """Apply one journal record to a progress dict"""
+        tf_family = record["tf"]
+        if "motif" not in record:
+            progress[tf_family] = record["entry"]
+            return
+
+        # Initialize TF family entry if it doesn't exist
+        family_data = progress.setdefault(
+            tf_family,
+            {"status": "in_progress", "timestamp": record["entry"]["timestamp"], "details": {}},
+        )
+        motif_reports = family_data["details"].setdefault("motif_reports", {})
+        motif_reports[record["motif"]] = record["entry"]
+
+        # Update TF family status if all motif reports are completed
+        if all(report["status"] == "completed" for report in motif_reports.values()):
+            family_data["status"] = "completed"
+
+    def _append_progress_record(self, record):
+        """Apply a progress record in memory and append it to the journal"""
+        self._apply_progress_record(self._progress, record)
+        if self._progress_log is None:
+            self._progress_log = open(self.progress_log_file, "ab", buffering=0)
+        # One unbuffered write per record, so the journal is never rewritten
+        self._progress_log.write(_dumps(record) + b"\n")
+        self._progress_updated()
+
+    @staticmethod
+    def _write_file_atomic(path, data):
+        """Replace a file's contents via a temp file, so readers never see a partial write"""
+        tmp_file = path.with_name(f"{path.name}.tmp")
+        try:
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, path)
+        except Exception:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def _compact_progress(self):
+        """Snapshot the in-memory progress and drop the journal; returns False on failure"""
+        try:
+            # Replace the snapshot atomically, so a crash mid-write can never leave a
+            # truncated snapshot with its journal already gone
+            self._write_file_atomic(self.progress_file, _dumps(self._progress))
+            if self._progress_log is not None:
+                self._progress_log.close()
+                self._progress_log = None
+            self.progress_log_file.unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write progress file: {e}")
+            return False
+
+    def _flush_progress(self, compact=False):
+        """Write queued completed TFs to disk, optionally compacting the progress journal"""
+        if compact and (self._progress_log is not None or self.progress_log_file.exists()):
+            self._compact_progress()
+
+        if self._unflushed_completed:
+            try:
+                # A single O_APPEND write so concurrent appends never interleave
+                data = "".join(f"{tf_name}\n" for tf_name in self._unflushed_completed)
+                fd = os.open(self.completed_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, data.encode("utf-8"))
+                finally:
+                    os.close(fd)
+                self._unflushed_completed = []
+            except Exception as e:
+                logger.warning(f"Could not write completed TFs: {e}")
+
+    def _progress_updated(self):
+        """Record a progress update, flushing to disk every PROGRESS_FLUSH_INTERVAL updates"""
+        self._unflushed_updates += 1
+        if self._unflushed_updates >= self.PROGRESS_FLUSH_INTERVAL:
+            self._flush_progress()
+            self._unflushed_updates = 0
 
     def load_progress(self):
         """Load progress from previous runs"""
-        completed_tfs = set()
-        progress_data = {}
+        # Fold in worker files left behind by an interrupted parallel run
+        self.finalize()
 
         # Load completed TF families
         if self.completed_file.exists():
             try:
                 with open(self.completed_file) as f:
-                    completed_tfs = set(line.strip() for line in f if line.strip())
-                logger.info(f"Found {len(completed_tfs)} previously completed TF families")
+                    self._completed = set(line.strip() for line in f if line.strip())
+                logger.info(f"Found {len(self._completed)} previously completed TF families")
             except Exception as e:
                 logger.warning(f"Could not load completed TFs: {e}")
 
-        # Load detailed progress data
-        if self.progress_file.exists():
-            try:
-                with open(self.progress_file) as f:
-                    progress_data = json.load(f)
-                logger.info(f"Loaded progress data with {len(progress_data)} entries")
-            except Exception as e:
-                logger.warning(f"Could not load progress data: {e}")
+        # Detailed progress data is already held in memory
+        progress_data = self._progress
+        if progress_data:
+            logger.info(f"Loaded progress data with {len(progress_data)} entries")
 
-        return completed_tfs, progress_data
+        return self._completed, progress_data
 
     def save_progress(self, tf_name, status, details=None):
         """Save progress for a TF family"""
         try:
-            # Load existing progress
-            progress_data = {}
-            if self.progress_file.exists():
-                try:
-                    with open(self.progress_file) as f:
-                        progress_data = json.load(f)
-                except Exception:
-                    pass
+            # If completed, queue it for the completed file
+            if status == "completed" and tf_name not in self._completed:
+                self._completed.add(tf_name)
+                self._unflushed_completed.append(tf_name)
 
             # Update progress
-            progress_data[tf_name] = {
+            entry = {
                 "status": status,
                 "timestamp": time.time(),
                 "details": details or {},
             }
-
-            # Save progress file
-            with open(self.progress_file, "w") as f:
-                json.dump(progress_data, f, indent=2)
-
-            # If completed, add to completed file
-            if status == "completed":
-                with open(self.completed_file, "a") as f:
-                    f.write(f"{tf_name}\n")
+            self._append_progress_record({"tf": tf_name, "entry": entry})
 
         except Exception as e:
             logger.warning(f"Could not save progress for {tf_name}: {e}")
 
+    @staticmethod
+    def _motif_key(tf_name, species_name):
+        """Key of a motif report within its TF family's progress entry"""
+        return f"{tf_name}_{species_name}".replace(" ", "_")
+
     def save_motif_progress(self, tf_name, species_name, status, details=None):
         """Save progress for an individual motif report within a TF family"""
         try:
-            # Load existing progress
-            progress_data = {}
-            if self.progress_file.exists():
-                try:
-                    with open(self.progress_file) as f:
-                        progress_data = json.load(f)
-                except Exception:
-                    pass
-
-            # Create motif report key
-            motif_key = f"{tf_name}_{species_name}".replace(" ", "_")
-
-            # Initialize TF family entry if it doesn't exist
+            motif_key = self._motif_key(tf_name, species_name)
             tf_family = details.get("tf_family", tf_name) if details else tf_name
-            if tf_family not in progress_data:
-                progress_data[tf_family] = {
-                    "status": "in_progress",
-                    "timestamp": time.time(),
-                    "details": {"motif_reports": {}},
-                }
-
-            # Ensure motif_reports exists
-            if "motif_reports" not in progress_data[tf_family]["details"]:
-                progress_data[tf_family]["details"]["motif_reports"] = {}
 
             # Update motif report progress
-            progress_data[tf_family]["details"]["motif_reports"][motif_key] = {
+            entry = {
                 "tf_name": tf_name,
                 "species_name": species_name,
                 "status": status,
                 "timestamp": time.time(),
                 "details": details or {},
             }
-
-            # Update TF family status if all motif reports are completed
-            motif_reports = progress_data[tf_family]["details"]["motif_reports"]
-            if all(report["status"] == "completed" for report in motif_reports.values()):
-                progress_data[tf_family]["status"] = "completed"
-
-            # Save progress file
-            with open(self.progress_file, "w") as f:
-                json.dump(progress_data, f, indent=2)
+            self._append_progress_record({"tf": tf_family, "motif": motif_key, "entry": entry})
 
         except Exception as e:
             logger.warning(f"Could not save motif progress for {tf_name} - {species_name}: {e}")
@@ -287,55 +627,50 @@ class CollecTFSeleniumDownloader:
     def log_tf_family_results(self, tf_family, results):
         """Log the results for a TF family to a text file"""
         try:
-            with open(self.family_log_file, "a", encoding="utf-8") as f:
-                f.write(f"\n{'=' * 80}\n")
-                f.write(f"TF FAMILY: {tf_family}\n")
-                f.write(f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'=' * 80}\n")
-
-                successful = []
-                no_export = []
-                failed = []
-
-                for result in results:
-                    tf_name = result["tf_name"]
-                    species_name = result["species_name"]
-                    status = result["status"]
-                    entry = f"  • {tf_name} - {species_name}"
-
-                    if status == "completed":
-                        successful.append(entry)
-                    elif status == "no_export":
-                        no_export.append(entry)
-                    else:
-                        failed.append(entry)
-
-                f.write(f"\n✅ SUCCESSFUL DOWNLOADS ({len(successful)}):\n")
-                if successful:
-                    for entry in successful:
-                        f.write(f"{entry}\n")
+            successful = []
+            no_export = []
+            failed = []
+
+            for result in results:
+                tf_name = result["tf_name"]
+                species_name = result["species_name"]
+                status = result["status"]
+                entry = f"  • {tf_name} - {species_name}"
+
+                if status == "completed":
+                    successful.append(entry)
+                elif status == "no_export":
+                    no_export.append(entry)
                 else:
-                    f.write("  (none)\n")
-
-                f.write(f"\n⚠️  NO EXPORT FUNCTIONALITY ({len(no_export)}):\n")
-                if no_export:
-                    for entry in no_export:
-                        f.write(f"{entry}\n")
+                    failed.append(entry)
+
+            # Build the whole block first so it is written in one go
+            lines = [
+                f"\n{'=' * 80}\n",
+                f"TF FAMILY: {tf_family}\n",
+                f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"{'=' * 80}\n",
+            ]
+
+            for heading, entries in [
+                (f"\n✅ SUCCESSFUL DOWNLOADS ({len(successful)}):\n", successful),
+                (f"\n⚠️  NO EXPORT FUNCTIONALITY ({len(no_export)}):\n", no_export),
+                (f"\n❌ FAILED DOWNLOADS ({len(failed)}):\n", failed),
+            ]:
+                lines.append(heading)
+                if entries:
+                    lines.extend(f"{entry}\n" for entry in entries)
                 else:
-                    f.write("  (none)\n")
+                    lines.append("  (none)\n")
 
-                f.write(f"\n❌ FAILED DOWNLOADS ({len(failed)}):\n")
-                if failed:
-                    for entry in failed:
-                        f.write(f"{entry}\n")
-                else:
-                    f.write("  (none)\n")
+            lines.append(
+                f"\nSUMMARY: {len(successful)} successful, {len(no_export)} no export, "
+                f"{len(failed)} failed\n"
+            )
+            lines.append(f"TOTAL PROCESSED: {len(results)}\n")
 
-                f.write(
-                    f"\nSUMMARY: {len(successful)} successful, {len(no_export)} no export, "
-                    f"{len(failed)} failed\n"
-                )
-                f.write(f"TOTAL PROCESSED: {len(results)}\n")
+            with open(self.family_log_file, "a", encoding="utf-8", buffering=1 << 16) as f:
+                f.write("".join(lines))
 
         except Exception as e:
             logger.warning(f"Could not log TF family results for {tf_family}: {e}")
@@ -409,7 +744,7 @@ class CollecTFSeleniumDownloader:
             logger.info(f"Step 1: Navigating to TF families page: {tf_families_url}")
 
             self.driver.get(tf_families_url)
-            time.sleep(3)  # Wait for page to load
+            self._wait_for(self.TF_FAMILIES_PAGE_READY, "TF family links")
 
             # Check if page loaded successfully
             page_title = self.driver.title
@@ -421,54 +756,15 @@ class CollecTFSeleniumDownloader:
             logger.error(f"Error navigating to TF families page: {e}")
             return False
 
-    def find_and_click_tf_family_links(self, max_tfs=5, completed_tfs=None, progress_data=None):
+    def find_and_click_tf_family_links(
+        self, max_tfs=5, completed_tfs=None, progress_data=None, workers=1
+    ):
         """Step 2: Find TF family links and click them"""
         try:
-            logger.info("Step 2: Looking for TF family links to click")
-
             # Find all links that look like TF names
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
-
-            tf_links = []
-            for link in all_links:
-                try:
-                    text = link.text.strip()
-                    href = link.get_attribute("href")
-
-                    # Skip empty or very short names
-                    if len(text) < 2 or len(text) > 20:
-                        continue
-
-                    # Skip common navigation words
-                    skip_words = {
-                        "browse",
-                        "search",
-                        "about",
-                        "home",
-                        "view",
-                        "more",
-                        "here",
-                        "feedback",
-                        "stats",
-                        "links",
-                        "cite",
-                        "contribute",
-                        "compare",
-                        "register",
-                        "login",
-                        "quick",
-                        "help",
-                        "contact",
-                    }
-                    if text.lower() in skip_words:
-                        continue
-
-                    # Look for TF-like names (alphanumeric, reasonable length)
-                    if re.match(r"^[A-Za-z][A-Za-z0-9/]{1,15}$", text):
-                        tf_links.append({"name": text, "element": link, "href": href})
+            tf_links = self.fetch_tf_family_links()
 
-                except Exception:
-                    continue  # Skip problematic links
+            logger.info("Step 2: Processing TF family links")
 
             logger.info(f"Found {len(tf_links)} potential TF family links")
             for tf in tf_links[:10]:  # Show first 10
@@ -491,83 +787,13 @@ class CollecTFSeleniumDownloader:
             else:
                 logger.info(f"Processing all {len(tf_links)} remaining TF families")
 
-            successful_downloads = 0
-            failed_tfs = []
-
-            # Click each TF family link
-            for i, tf_link in enumerate(tf_links):
-                tf_name = tf_link["name"]
-                logger.info(f"\n=== Processing TF Family {i + 1}/{len(tf_links)}: {tf_name} ===")
-
-                try:
-                    # Re-find the element to avoid stale reference
-                    current_tf_link = None
-
-                    # Wait a bit for page to fully load
-                    time.sleep(1)
-
-                    # Try multiple strategies to find the TF link
-                    strategies = [
-                        # Strategy 1: Exact text match
-                        lambda: self.driver.find_element(By.LINK_TEXT, tf_name),
-                        # Strategy 2: Partial text match
-                        lambda: self.driver.find_element(By.PARTIAL_LINK_TEXT, tf_name),
-                        # Strategy 3: Search all links manually
-                        lambda: self._find_link_by_text(tf_name),
-                    ]
-
-                    for strategy in strategies:
-                        try:
-                            current_tf_link = strategy()
-                            if current_tf_link:
-                                logger.info(f"✓ Re-found TF link for {tf_name}")
-                                break
-                        except Exception:
-                            continue
-
-                    if not current_tf_link:
-                        logger.warning(f"Could not re-find TF link for {tf_name}")
-                        continue
-
-                    # Click the TF family link
-                    logger.info(f"Clicking TF family link: {tf_name}")
-                    current_tf_link.click()
-                    time.sleep(3)  # Wait for page to load
-
-                    # Process species on this TF page
-                    species_downloads = self.process_tf_species_page(tf_name)
-                    successful_downloads += species_downloads
-
-                    # Progress is now tracked at the motif level in process_tf_species_page
-                    # Just log the summary here
-                    if species_downloads > 0:
-                        logger.info(
-                            f"✅ Completed {tf_name}: {species_downloads} motif reports downloaded"
-                        )
-                    else:
-                        logger.info(f"⚠️ Completed {tf_name}: no downloadable motif reports found")
-
-                    # Go back to TF families page (refresh instead of back to avoid stale elements)
-                    logger.info("Returning to TF families page...")
-                    if not self.navigate_to_tf_families_page():
-                        logger.error("Failed to navigate back to TF families page")
-                        break
-                    time.sleep(1)
-
-                except Exception as e:
-                    logger.error(f"Error processing TF family {tf_name}: {e}")
-                    failed_tfs.append(tf_name)
-
-                    # Save error progress
-                    self.save_progress(tf_name, "error", {"error": str(e)})
-
-                    # Try to go back to TF families page
-                    try:
-                        self.navigate_to_tf_families_page()
-                    except Exception:
-                        logger.error("Could not navigate back to TF families page, stopping")
-                        break
-                    continue
+            if workers > 1 and len(tf_links) > 1:
+                successful_downloads, failed_tfs = self._process_tf_families_parallel(
+                    tf_links, workers, progress_data
+                )
+            else:
+                self._ensure_browser()
+                successful_downloads, failed_tfs = self._process_tf_families(tf_links)
 
             logger.info("\n=== All TF Families Complete ===")
             logger.info(f"Total successful downloads: {successful_downloads}")
@@ -589,136 +815,390 @@ class CollecTFSeleniumDownloader:
             logger.error(f"Error finding TF family links: {e}")
             return 0
 
-    def process_tf_species_page(self, tf_name):
-        """Step 3: Process the TF species page and find 'view' links"""
+    def _open_tf_family_page(self, tf_link):
+        """Open a TF family page in the browser directly from its collected href"""
+        tf_name = tf_link["name"]
+        if not tf_link.get("href"):
+            logger.warning(f"No link found for TF family {tf_name}")
+            return False
+
+        logger.info(f"Opening TF family page: {tf_name}")
+        self.driver.get(tf_link["href"])
+        self._wait_for(self.SPECIES_PAGE_READY, f"species table for {tf_name}")
+        return True
+
+    def _get_cached_view_links(self, tf_name):
+        """Return cached species view links for a TF family, or None if missing or expired"""
+        entry = self._href_cache.get(tf_name)
+        if not entry or time.time() - entry["timestamp"] > self.HREF_CACHE_TTL:
+            return None
+        logger.info(f"Using cached species links for {tf_name}")
+        return entry["view_links"]
+
+    def _cache_view_links(self, tf_name, view_links):
+        """Store the species view links for a TF family in the href cache"""
+        # An empty list is more likely an error page than a family without species
+        if not view_links:
+            return
+
+        entry = {"timestamp": time.time(), "view_links": view_links}
+        self._href_cache[tf_name] = entry
+        self._href_cache_updates[tf_name] = entry
         try:
-            logger.info(f"Step 3: Processing species page for TF {tf_name}")
+            # Workers only write what they fetched, so their copy of older entries can't
+            # overwrite fresher ones from other workers in finalize()
+            cache = self._href_cache if self.worker_id is None else self._href_cache_updates
+            self._write_file_atomic(self.href_cache_file, _dumps(cache))
+        except Exception as e:
+            logger.warning(f"Could not write href cache: {e}")
+
+    def _get_view_links(self, tf_link):
+        """Get the species view links for a TF family from the cache, HTTP or the browser"""
+        tf_name = tf_link["name"]
+        view_links = self._get_cached_view_links(tf_name)
+        if view_links is not None:
+            return view_links
+
+        # The species table is static HTML; only fall back to the browser if needed
+        view_links = self.fetch_species_view_links(tf_link)
+        if view_links is None:
+            if not self._open_tf_family_page(tf_link):
+                return None
+            view_links = self._get_species_view_links_from_page(tf_name)
+
+        self._cache_view_links(tf_name, view_links)
+        return view_links
+
+    def _process_tf_families(self, tf_links):
+        """Process each TF family in turn using this instance's browser"""
+        successful_downloads = 0
+        failed_tfs = []
+
+        for i, tf_link in enumerate(tf_links):
+            tf_name = tf_link["name"]
+            logger.info(f"\n=== Processing TF Family {i + 1}/{len(tf_links)}: {tf_name} ===")
 
-            # Look for "view" links on this page
-            view_links = []
+            try:
+                view_links = self._get_view_links(tf_link)
+                if view_links is None:
+                    continue
 
-            # Find all links with "view" text
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
+                # Process species on this TF page
+                species_downloads = self.process_tf_species_page(tf_name, view_links)
+                successful_downloads += species_downloads
 
-            for link in all_links:
-                try:
-                    text = link.text.strip().lower()
-                    href = link.get_attribute("href")
+                # Progress is now tracked at the motif level in process_tf_species_page
+                # Just log the summary here
+                if species_downloads > 0:
+                    logger.info(
+                        f"✅ Completed {tf_name}: {species_downloads} motif reports downloaded"
+                    )
+                else:
+                    logger.info(f"⚠️ Completed {tf_name}: no downloadable motif reports found")
 
-                    if "view" in text and href and "view_motif_reports_by_TF_and_species" in href:
-                        # Extract TF and species IDs from URL
-                        match = re.search(
-                            r"/view_motif_reports_by_TF_and_species/(\d+)/(\d+)/", href
-                        )
-                        if match:
-                            tf_id, species_id = match.groups()
-
-                            # Extract individual TF name and species name from the table row
-                            individual_tf_name = tf_name  # fallback to family name
-                            species_name = "Unknown"
-                            try:
-                                row = link.find_element(By.XPATH, "./ancestor::tr")
-                                cells = row.find_elements(By.TAG_NAME, "td")
-
-                                if len(cells) >= 3:  # Should have TF, Species, View columns
-                                    # First column: individual TF name
-                                    tf_cell_text = cells[0].text.strip()
-                                    if tf_cell_text and len(tf_cell_text) < 20:
-                                        individual_tf_name = tf_cell_text
-
-                                    # Second column: species name
-                                    species_cell_text = cells[1].text.strip()
-                                    if species_cell_text and len(species_cell_text) > 5:
-                                        species_name = species_cell_text
-
-                                logger.info(f"  Found: {individual_tf_name} - {species_name}")
-                            except Exception as e:
-                                logger.debug(f"Error extracting row data: {e}")
-
-                            view_links.append(
-                                {
-                                    "tf_name": individual_tf_name,  # Individual TF name
-                                    "tf_family": tf_name,  # Family name (AraC/XylS)
-                                    "tf_id": int(tf_id),
-                                    "species_name": species_name,
-                                    "species_id": int(species_id),
-                                    "href": href,  # Store only the URL, not the element
-                                }
-                            )
+            except Exception as e:
+                logger.error(f"Error processing TF family {tf_name}: {e}")
+                failed_tfs.append(tf_name)
 
-                except Exception:
-                    continue
+                # Save error progress
+                self.save_progress(tf_name, "error", {"error": str(e)})
+                continue
 
-            logger.info(f"Found {len(view_links)} 'view' links for {tf_name}")
+        return successful_downloads, failed_tfs
 
-            successful_downloads = 0
-            family_results = []  # Track results for logging
+    def _process_tf_families_parallel(self, tf_links, workers, progress_data=None):
+        """Shard TF families across worker processes, each with its own browser"""
+        workers = min(workers, len(tf_links))
+        shards = [tf_links[i::workers] for i in range(workers)]
+        logger.info(f"Processing {len(tf_links)} TF families across {workers} workers")
 
-            # Click each view link
-            for j, view_link in enumerate(view_links):
-                species_name = view_link["species_name"]
-                tf_individual_name = view_link["tf_name"]
-                logger.info(
-                    f"\n--- Processing Species {j + 1}/{len(view_links)}: {species_name} ---"
+        successful_downloads = 0
+        failed_tfs = []
+        try:
+            # Spawn rather than fork: this process may already run a browser and threads
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                results = executor.map(
+                    self.process_tf_shard,
+                    shards,
+                    range(workers),
+                    [self.output_dir] * workers,
+                    [self.headless] * workers,
+                    [progress_data] * workers,
+                    [self.species_workers] * workers,
+                    [self.download_timeout] * workers,
                 )
+                for shard_downloads, shard_failed in results:
+                    successful_downloads += shard_downloads
+                    failed_tfs.extend(shard_failed)
+        finally:
+            self.finalize()
+
+        return successful_downloads, failed_tfs
+
+    @classmethod
+    def process_tf_shard(
+        cls,
+        tf_links,
+        worker_id,
+        output_dir,
+        headless=True,
+        progress_data=None,
+        species_workers=1,
+        download_timeout=30,
+    ):
+        """Process a shard of TF families in a worker process with its own browser"""
+        tf_names = [tf["name"] for tf in tf_links]
+        downloader = None
+        try:
+            # Inside the try, so a browser that fails to start only fails this shard
+            downloader = cls(
+                output_dir,
+                headless=headless,
+                worker_id=worker_id,
+                download_timeout=download_timeout,
+                species_workers=species_workers,
+            )
+
+            # Seed the worker progress file so motif reports from earlier runs are kept
+            if progress_data:
+                downloader._progress = {
+                    tf: progress_data[tf] for tf in tf_names if tf in progress_data
+                }
+                downloader._compact_progress()
+
+            return downloader._process_tf_families(tf_links)
+
+        except Exception as e:
+            logger.error(f"Worker {worker_id} failed: {e}")
+            return 0, tf_names
+        finally:
+            if downloader is not None:
+                downloader.close()
 
+    def finalize(self):
+        """Merge per-worker progress, href cache, completed and log files into the main files"""
+        if self.worker_id is not None:
+            return
+
+        try:
+            worker_cache_files = sorted(self.progress_dir.glob("href_cache_*.json"))
+            if worker_cache_files:
+                for worker_file in worker_cache_files:
+                    # Keep the newest entry for each TF family
+                    for tf_name, entry in self._read_json_file(worker_file).items():
+                        current = self._href_cache.get(tf_name)
+                        if current is None or entry["timestamp"] > current["timestamp"]:
+                            self._href_cache[tf_name] = entry
+
+                # Worker files are only removed once the merged cache is safely written
                 try:
-                    # Navigate directly to the motif report page
-                    logger.info(f"Navigating to motif report for {tf_name} - {species_name}")
-                    self.driver.get(view_link["href"])
-                    time.sleep(3)  # Wait for motif report page to load
+                    self._write_file_atomic(self.href_cache_file, _dumps(self._href_cache))
+                    for worker_file in worker_cache_files:
+                        worker_file.unlink()
+                except Exception as e:
+                    logger.warning(f"Could not write merged href cache: {e}")
+
+            # Each worker leaves a snapshot, plus a journal if it was interrupted
+            worker_files = self.progress_dir.glob("download_progress_*.json*")
+            worker_progress_files = sorted(
+                {path.with_suffix(".json") for path in worker_files if path.suffix != ".tmp"}
+            )
+            if worker_progress_files:
+                for worker_file in worker_progress_files:
+                    worker_log_file = worker_file.with_suffix(".jsonl")
+                    self._progress.update(self._load_progress_files(worker_file, worker_log_file))
+
+                # Worker files are only removed once the merged snapshot is safely written
+                if self._compact_progress():
+                    for worker_file in worker_progress_files:
+                        worker_file.unlink(missing_ok=True)
+                        worker_file.with_suffix(".jsonl").unlink(missing_ok=True)
+
+            # Text files are simply concatenated onto the main files
+            for main_file, pattern in [
+                (self.completed_file, "completed_tfs_*.txt"),
+                (self.family_log_file, "tf_family_results_*.txt"),
+            ]:
+                for worker_file in sorted(self.progress_dir.glob(pattern)):
+                    with open(main_file, "a", encoding="utf-8") as f:
+                        f.write(worker_file.read_text(encoding="utf-8"))
+                    worker_file.unlink()
+
+        except Exception as e:
+            logger.warning(f"Could not merge worker progress files: {e}")
+
+    @staticmethod
+    def _make_view_link(tf_name, href, cell_texts):
+        """Build a view link entry from a species table row, or None if href doesn't match"""
+        # Extract TF and species IDs from URL
+        match = VIEW_LINK_RE.search(href)
+        if not match:
+            return None
+        tf_id, species_id = match.groups()
+
+        # Extract individual TF name and species name from the table row
+        individual_tf_name = tf_name  # fallback to family name
+        species_name = "Unknown"
+        if len(cell_texts) >= 3:  # Should have TF, Species, View columns
+            # First column: individual TF name
+            tf_cell_text = cell_texts[0].strip()
+            if tf_cell_text and len(tf_cell_text) < 20:
+                individual_tf_name = tf_cell_text
+
+            # Second column: species name
+            species_cell_text = cell_texts[1].strip()
+            if species_cell_text and len(species_cell_text) > 5:
+                species_name = species_cell_text
+
+        logger.info(f"  Found: {individual_tf_name} - {species_name}")
+
+        return {
+            "tf_name": individual_tf_name,  # Individual TF name
+            "tf_family": tf_name,  # Family name (AraC/XylS)
+            "tf_id": int(tf_id),
+            "species_name": species_name,
+            "species_id": int(species_id),
+            "href": href,  # Store only the URL, not the element
+        }
+
+    def fetch_species_view_links(self, tf_link):
+        """Fetch the species 'view' links for a TF family over HTTP, or None if none are found"""
+        tf_name = tf_link["name"]
+        if not tf_link.get("href"):
+            return None
+
+        try:
+            tree = self._fetch_html(tf_link["href"])
+        except Exception as e:
+            logger.warning(f"Could not fetch species page for {tf_name} over HTTP: {e}")
+            return None
+
+        view_links = []
+        for link in tree.xpath("//a[contains(@href, 'view_motif_reports_by_TF_and_species')]"):
+            if "view" not in link.text_content().strip().lower():
+                continue
+            rows = link.xpath("./ancestor::tr[1]")
+            cell_texts = [td.text_content() for td in rows[0].xpath("./td")] if rows else []
+            view_link = self._make_view_link(tf_name, link.get("href"), cell_texts)
+            if view_link:
+                view_links.append(view_link)
+
+        # Let the browser check pages that came back without any species table
+        if not view_links:
+            logger.warning(f"No species links found for {tf_name} over HTTP, using browser")
+            return None
+
+        return view_links
+
+    def _get_species_view_links_from_page(self, tf_name):
+        """Find the species 'view' links on the TF species page open in the browser"""
+        view_links = []
+
+        # Scrape every "view" link once, with the cell texts of its own row (not of any
+        # layout rows around it), as fetch_species_view_links does
+        rows = self.driver.execute_script(
+            """
+            const seen = new Set();
+            return [...document.querySelectorAll(
+                'a[href*="view_motif_reports_by_TF_and_species"]'
+            )].filter(a => {
+                if (!a.innerText.toLowerCase().includes('view') || seen.has(a.href)) {
+                    return false;
+                }
+                seen.add(a.href);
+                return true;
+            }).map(a => {
+                const row = a.closest('tr');
+                const cells = row ? [...row.children].filter(c => c.tagName === 'TD') : [];
+                return [cells.map(c => c.innerText), a.href];
+            });
+            """
+        )
 
-                    # Process the motif report page
-                    result = self.process_motif_report_page(view_link)
+        for cell_texts, href in rows:
+            if href:
+                view_link = self._make_view_link(tf_name, href, cell_texts)
+                if view_link:
+                    view_links.append(view_link)
 
-                    # Track result for logging
+        return view_links
+
+    def process_tf_species_page(self, tf_name, view_links=None):
+        """Step 3: Process the TF species page and find 'view' links"""
+        try:
+            logger.info(f"Step 3: Processing species page for TF {tf_name}")
+
+            # Look for "view" links on the open page unless they were already fetched
+            if view_links is None:
+                view_links = self._get_species_view_links_from_page(tf_name)
+
+            logger.info(f"Found {len(view_links)} 'view' links for {tf_name}")
+
+            successful_downloads = 0
+            family_results = []  # Track results for logging
+
+            # Skip motif reports downloaded by an earlier run before touching the browser
+            motif_reports = (
+                self._progress.get(tf_name, {}).get("details", {}).get("motif_reports", {})
+            )
+            pending_links = []
+            for view_link in view_links:
+                motif_key = self._motif_key(view_link["tf_name"], view_link["species_name"])
+                if motif_reports.get(motif_key, {}).get("status") == "completed":
                     family_results.append(
                         {
-                            "tf_name": tf_individual_name,
-                            "species_name": species_name,
-                            "status": result,
+                            "tf_name": view_link["tf_name"],
+                            "species_name": view_link["species_name"],
+                            "status": "completed",
                         }
                     )
+                else:
+                    pending_links.append(view_link)
+            if len(pending_links) < len(view_links):
+                logger.info(
+                    f"Skipping {len(view_links) - len(pending_links)} motif reports "
+                    "already downloaded"
+                )
+            view_links = pending_links
 
-                    if result == "completed":
-                        successful_downloads += 1
-                        self.save_motif_progress(
-                            tf_individual_name,
-                            species_name,
-                            "completed",
-                            {"downloaded": True, "tf_family": tf_name},
-                        )
-                    elif result == "no_export":
-                        self.save_motif_progress(
-                            tf_individual_name,
-                            species_name,
-                            "no_export",
-                            {"reason": "no export functionality", "tf_family": tf_name},
-                        )
-                    else:
-                        self.save_motif_progress(
-                            tf_individual_name,
-                            species_name,
-                            "no_data",
-                            {"reason": "download failed", "tf_family": tf_name},
-                        )
+            # Download each motif report
+            for view_link, result in self._iter_motif_report_results(view_links):
+                species_name = view_link["species_name"]
+                tf_individual_name = view_link["tf_name"]
 
-                    # Go back to TF species page
-                    logger.info("Going back to TF species page...")
-                    self.driver.back()
-                    time.sleep(2)
+                # Track result for logging
+                family_results.append(
+                    {
+                        "tf_name": tf_individual_name,
+                        "species_name": species_name,
+                        "status": result or "failed",
+                    }
+                )
 
-                except Exception as e:
-                    logger.error(f"Error processing species {species_name}: {e}")
-                    # Track failed result
-                    family_results.append(
-                        {
-                            "tf_name": tf_individual_name,
-                            "species_name": species_name,
-                            "status": "failed",
-                        }
+                if result == "completed":
+                    successful_downloads += 1
+                    self.save_motif_progress(
+                        tf_individual_name,
+                        species_name,
+                        "completed",
+                        {"downloaded": True, "tf_family": tf_name},
+                    )
+                elif result == "no_export":
+                    self.save_motif_progress(
+                        tf_individual_name,
+                        species_name,
+                        "no_export",
+                        {"reason": "no export functionality", "tf_family": tf_name},
+                    )
+                elif result is not None:
+                    self.save_motif_progress(
+                        tf_individual_name,
+                        species_name,
+                        "no_data",
+                        {"reason": "download failed", "tf_family": tf_name},
                     )
-                    continue
 
             # Log results for this TF family
             self.log_tf_family_results(tf_name, family_results)
@@ -729,6 +1209,86 @@ class CollecTFSeleniumDownloader:
             logger.error(f"Error processing TF species page for {tf_name}: {e}")
             return 0
 
+    def download_motif_report(self, view_link):
+        """Open a motif report page and download its PSFM; returns None if the page errored"""
+        tf_name = view_link["tf_family"]
+        species_name = view_link["species_name"]
+        try:
+            # Navigate directly to the motif report page
+            logger.info(f"Navigating to motif report for {tf_name} - {species_name}")
+            self.driver.get(view_link["href"])
+            self._wait_for(self.MOTIF_PAGE_READY, "motif report page")
+
+            # Process the motif report page
+            return self.process_motif_report_page(view_link)
+
+        except Exception as e:
+            logger.error(f"Error processing species {species_name}: {e}")
+            return None
+
+    def _iter_motif_report_results(self, view_links):
+        """Yield (view_link, result) for each motif report, using the browser pool if enabled"""
+        if self.species_workers <= 1 or len(view_links) <= 1:
+            for j, view_link in enumerate(view_links):
+                logger.info(
+                    f"\n--- Processing Species {j + 1}/{len(view_links)}: "
+                    f"{view_link['species_name']} ---"
+                )
+                yield view_link, self.download_motif_report(view_link)
+            return
+
+        if self._species_executor is None:
+            self._species_executor = ThreadPoolExecutor(max_workers=self.species_workers)
+
+        logger.info(
+            f"Downloading {len(view_links)} motif reports with {self.species_workers} browsers"
+        )
+        submit = self._species_executor.submit
+        futures = {submit(self._download_motif_report_in_thread, vl): vl for vl in view_links}
+        for future in as_completed(futures):
+            view_link = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # e.g. this thread's browser failed to start; only this report is lost
+                logger.error(f"Error processing species {view_link['species_name']}: {e}")
+                result = None
+            yield view_link, result
+
+    def _download_motif_report_in_thread(self, view_link):
+        """Download a motif report with the calling thread's own browser"""
+        return self._get_species_clone().download_motif_report(view_link)
+
+    def _get_species_clone(self):
+        """Return this thread's downloader, creating it with its own browser on first use"""
+        clone = getattr(self._species_local, "clone", None)
+        if clone is None:
+            with self._species_lock:
+                index = next(self._species_clone_ids)
+            clone = copy.copy(self)
+            clone._species_executor = None
+            clone._species_clones = []
+
+            # Shares progress and output dirs; gets its own browser, session and download dir
+            clone.download_dir = self.download_dir / f"thread_{index}"
+            clone.download_dir.mkdir(parents=True, exist_ok=True)
+            clone.http = clone._build_http_session()
+            clone._http_cookie_origin = None
+            clone._start_download_observer()
+            try:
+                clone._start_driver()
+            except Exception:
+                # The clone still holds the parent's driver, so it must never be closed;
+                # the next report on this thread tries to start a browser again
+                clone._stop_download_observer()
+                raise
+
+            # Only clones with their own browser are closed along with this instance
+            with self._species_lock:
+                self._species_clones.append(clone)
+            self._species_local.clone = clone
+        return clone
+
     def process_motif_report_page(self, view_link):
         """Step 4: Process motif report page and download PSFM"""
         try:
@@ -737,20 +1297,27 @@ class CollecTFSeleniumDownloader:
 
             logger.info(f"Step 4: Processing motif report for {tf_name} - {species_name}")
 
-            # Check if this page has export functionality
-            page_source = self.driver.page_source
-
-            export_indicators = {
-                "Export data": "Export data" in page_source,
-                "PSFM": "PSFM" in page_source,
-                "site_id": "site_id" in page_source,
-                "csrfmiddlewaretoken": "csrfmiddlewaretoken" in page_source,
-                "Download PSFM": "Download PSFM" in page_source,
-            }
+            # Check if this page has export functionality, in the browser rather than
+            # transferring the whole page source
+            export_indicators = self.driver.execute_script(
+                r"""
+                const markers = arguments[0], html = document.documentElement.outerHTML;
+                const escaped = markers.map(m => m.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+                const found = new Set();
+                // One pass over the HTML, stopping as soon as every marker has been seen
+                for (const match of html.matchAll(new RegExp(escaped.join('|'), 'g'))) {
+                    // A longer marker ("Download PSFM") also contains shorter ones ("PSFM")
+                    markers.filter(m => match[0].includes(m)).forEach(m => found.add(m));
+                    if (found.size === markers.length) break;
+                }
+                return Object.fromEntries(markers.map(m => [m, found.has(m)]));
+                """,
+                self.EXPORT_INDICATORS,
+            )
 
             logger.info("Export functionality check:")
-            for indicator, present in export_indicators.items():
-                logger.info(f"  {indicator}: {'✓' if present else '✗'}")
+            for indicator in self.EXPORT_INDICATORS:
+                logger.info(f"  {indicator}: {'✓' if export_indicators[indicator] else '✗'}")
 
             # Only proceed if we have the key export indicators
             if not (export_indicators["Export data"] and export_indicators["csrfmiddlewaretoken"]):
@@ -763,11 +1330,20 @@ class CollecTFSeleniumDownloader:
                 export_tab = self.driver.find_element(By.PARTIAL_LINK_TEXT, "Export data")
                 logger.info("Found 'Export data' tab, clicking...")
                 export_tab.click()
-                time.sleep(5)  # Wait longer for dynamic content to load
 
                 # Wait for the export content to appear
                 logger.info("Waiting for export content to load...")
-                time.sleep(3)
+                try:
+                    WebDriverWait(self.driver, 15, poll_frequency=0.2).until(
+                        EC.any_of(
+                            EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, "Download PSFM")),
+                            lambda driver: driver.execute_script(
+                                self.FIND_TEXT_CELL_JS, ["raw FASTA format"]
+                            )[0],
+                        )
+                    )
+                except TimeoutException:
+                    logger.warning("Timed out waiting for export content")
 
             except NoSuchElementException:
                 logger.info("No 'Export data' tab found, assuming export form is already visible")
@@ -797,152 +1373,152 @@ class CollecTFSeleniumDownloader:
                 # If direct link not found, search all links for PSFM
                 if not psfm_link:
                     logger.info("Direct link not found, searching all links...")
-                    all_links = self.driver.find_elements(By.TAG_NAME, "a")
 
-                    logger.info(f"Found {len(all_links)} total links on the page")
+                    # Search every link in the browser in one call; the full link list is
+                    # only sent back when debug logging will show it
+                    found = self.driver.execute_script(
+                        """
+                        const patterns = arguments[0], dumpAll = arguments[1];
+                        const links = [...document.querySelectorAll('a')];
+                        const match = links.find(
+                            a => patterns.some(p => a.innerText.includes(p))
+                        );
+                        return {
+                            count: links.length,
+                            match: match || null,
+                            text: match ? match.innerText.trim() : null,
+                            links: dumpAll
+                                ? links.map(a => [a.innerText.trim(), a.href]).filter(l => l[0])
+                                : [],
+                        };
+                        """,
+                        psfm_patterns,
+                        logger.isEnabledFor(logging.DEBUG),
+                    )
+
+                    logger.info(f"Found {found['count']} total links on the page")
 
                     # Show all links for debugging
-                    for i, link in enumerate(all_links):
-                        try:
-                            link_text = link.text.strip()
-                            href = link.get_attribute("href")
-                            if link_text:  # Only show non-empty links
-                                logger.info(f"  Link {i + 1}: '{link_text}' -> {href}")
-
-                                # Check for PSFM patterns
-                                if any(pattern in link_text for pattern in psfm_patterns):
-                                    psfm_link = link
-                                    logger.info(f"✓ Found PSFM link: '{link_text}'")
-                                    break
-                        except Exception as e:
-                            logger.debug(f"Error checking link {i}: {e}")
-                            continue
+                    for i, (link_text, href) in enumerate(found["links"]):
+                        logger.debug(f"  Link {i + 1}: '{link_text}' -> {href}")
+
+                    if found["match"] is not None:
+                        psfm_link = found["match"]
+                        logger.info(f"✓ Found PSFM link: '{found['text']}'")
 
                 # If still not found, look for the specific PSFM raw-FASTA text in table cells
                 if not psfm_link:
-                    try:
-                        # Look for the exact text we saw in the debug output
-                        psfm_text = (
-                            "Download Position-Specific-Frequency-Matrix of the motif "
-                            "in raw FASTA format"
-                        )
-                        psfm_element = self.driver.find_element(
-                            By.XPATH, f"//td[contains(text(), '{psfm_text}')]"
-                        )
+                    # Look for the exact text we saw in the debug output, falling back to any
+                    # td containing "raw FASTA format"; both are checked in one browser call
+                    # instead of two XPath scans of the whole DOM
+                    psfm_text = (
+                        "Download Position-Specific-Frequency-Matrix of the motif "
+                        "in raw FASTA format"
+                    )
+                    psfm_element, match_index = self.driver.execute_script(
+                        self.FIND_TEXT_CELL_JS, [psfm_text, "raw FASTA format"]
+                    )
 
-                        if psfm_element:
+                    if psfm_element is not None:
+                        if match_index == 0:
                             logger.info(f"✓ Found PSFM table cell with text: '{psfm_text[:50]}...'")
-                            # This table cell should be clickable
-                            psfm_link = psfm_element
-
-                    except NoSuchElementException:
-                        # Fallback: look for any td containing "raw FASTA format"
-                        try:
-                            psfm_element = self.driver.find_element(
-                                By.XPATH, "//td[contains(text(), 'raw FASTA format')]"
-                            )
-                            if psfm_element:
-                                logger.info("✓ Found PSFM table cell with 'raw FASTA format'")
-                                psfm_link = psfm_element
-                        except NoSuchElementException:
-                            pass
+                        else:
+                            logger.info("✓ Found PSFM table cell with 'raw FASTA format'")
+                        # This table cell should be clickable
+                        psfm_link = psfm_element
 
                 if psfm_link:
-                    logger.info("Found PSFM download link, clicking...")
-                    logger.info(f"Element tag: {psfm_link.tag_name}")
-                    logger.info(f"Element text: {psfm_link.text[:100]}...")
+                    # Scroll to the element and describe it and the clickable elements in its
+                    # row in one browser call, instead of a round trip per property
+                    info = self.driver.execute_script(
+                        """
+                        const el = arguments[0], row = el.closest('tr');
+                        el.scrollIntoView(true);
+                        const kids = row
+                            ? [...row.querySelectorAll("input[type='submit'], button, a")]
+                            : [];
+                        return {
+                            tag: el.tagName.toLowerCase(),
+                            text: el.innerText.slice(0, 100),
+                            row: row !== null,
+                            kids: kids.map(k => [
+                                k, k.tagName.toLowerCase(), k.innerText || k.value || k.name || ''
+                            ]),
+                        };
+                        """,
+                        psfm_link,
+                    )
 
-                    # Clear any existing downloads
-                    import glob
+                    logger.info("Found PSFM download link, clicking...")
+                    logger.info(f"Element tag: {info['tag']}")
+                    logger.info(f"Element text: {info['text']}...")
 
-                    existing_files = glob.glob(str(self.download_dir / "*"))
-                    logger.info(f"Cleared {len(existing_files)} existing files from download dir")
+                    # Note files already in the download dir so they aren't taken for this one
+                    with os.scandir(self.download_dir) as it:
+                        existing_files = {entry.path for entry in it}
+                    logger.info(f"Ignoring {len(existing_files)} existing files in download dir")
 
                     # Check if the element is actually clickable
                     try:
-                        # Try to scroll to element first
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", psfm_link)
-                        time.sleep(1)
-
                         # Check if there's a form or button we should click instead
                         logger.info("Looking for form elements near the PSFM text...")
 
                         # Look for the actual download button/link in the same row
-                        try:
-                            # Find the parent row
-                            parent_row = psfm_link.find_element(By.XPATH, "./ancestor::tr")
-
-                            # Look for any clickable elements in this row
-                            clickable_elements = parent_row.find_elements(
-                                By.XPATH, ".//input[@type='submit'] | .//button | .//a"
+                        clickable_elements = info["kids"]
+                        if clickable_elements:
+                            logger.info(
+                                f"Found {len(clickable_elements)} clickable elements "
+                                "in the same row"
                             )
-
-                            if clickable_elements:
-                                logger.info(
-                                    f"Found {len(clickable_elements)} clickable elements "
-                                    "in the same row"
-                                )
-                                for i, elem in enumerate(clickable_elements):
-                                    try:
-                                        elem_text = (
-                                            elem.text
-                                            or elem.get_attribute("value")
-                                            or elem.get_attribute("name")
-                                        )
-                                        logger.info(
-                                            f"  Clickable {i + 1}: {elem.tag_name} - '{elem_text}'"
-                                        )
-
-                                        # If this looks like a download button, use it instead
-                                        if any(
-                                            word in elem_text.lower()
-                                            for word in ["download", "psfm", "fasta"]
-                                        ):
-                                            logger.info(
-                                                f"Using clickable element instead: {elem_text}"
-                                            )
-                                            psfm_link = elem
-                                            break
-                                    except Exception:
-                                        continue
-                        except Exception:
+                            for i, (elem, elem_tag, elem_text) in enumerate(clickable_elements):
+                                logger.info(f"  Clickable {i + 1}: {elem_tag} - '{elem_text}'")
+
+                                # If this looks like a download button, use it instead
+                                if any(
+                                    word in elem_text.lower()
+                                    for word in ["download", "psfm", "fasta"]
+                                ):
+                                    logger.info(f"Using clickable element instead: {elem_text}")
+                                    psfm_link = elem
+                                    break
+                        else:
                             logger.info("No parent row found or no clickable elements in row")
 
+                        # Fetch the PSFM over HTTP when the link is a plain GET or form
+                        # submit, skipping Chrome's download pipeline entirely
+                        downloaded_file = self.fetch_psfm_over_http(view_link, psfm_link)
+                        if downloaded_file:
+                            return self.save_psfm_content(
+                                view_link, downloaded_file, method="http_with_browser_cookies"
+                            )
+
                         # Click the download link
                         psfm_link.click()
                         logger.info("Clicked download element, waiting for file...")
 
-                        # Give it a moment to process
-                        time.sleep(2)
-
                     except Exception as click_error:
                         logger.error(f"Error clicking element: {click_error}")
                         return "failed"
 
                     # Wait for download to complete
-                    downloaded_file = self.wait_for_download()
+                    downloaded_file = self.wait_for_download(ignore=existing_files)
 
                     if downloaded_file:
                         logger.info(f"✓ Download completed: {downloaded_file}")
 
-                        # Read the downloaded file
+                        # Check the downloaded file without reading it into a string
                         try:
-                            with open(downloaded_file) as f:
-                                psfm_content = f.read().strip()
-
-                            if psfm_content and len(psfm_content) > 10:
-                                logger.info(f"✓ Read PSFM content ({len(psfm_content)} chars)")
+                            content_length = downloaded_file.stat().st_size
 
-                                # Save to our organized directory structure
-                                success = self.save_psfm_content(view_link, psfm_content)
+                            if content_length > 10:
+                                logger.info(f"✓ Downloaded PSFM content ({content_length} bytes)")
 
-                                # Clean up the temporary download
-                                with contextlib.suppress(Exception):
-                                    downloaded_file.unlink()
-
-                                return success
+                                # Move into our organized directory structure
+                                return self.save_psfm_content(view_link, downloaded_file)
                             else:
                                 logger.warning("Downloaded file appears to be empty or invalid")
+                                with contextlib.suppress(Exception):
+                                    downloaded_file.unlink()
                                 return "failed"
 
                         except Exception as e:
@@ -954,19 +1530,18 @@ class CollecTFSeleniumDownloader:
                 else:
                     logger.warning("No PSFM download link found")
 
+                    # Each element below costs WebDriver round trips, so only dump when debugging
+                    if not logger.isEnabledFor(logging.DEBUG):
+                        return "failed"
+
                     # Debug: Show all available links on the page
-                    logger.info("Available links on export page:")
-                    all_page_links = self.driver.find_elements(By.TAG_NAME, "a")
-                    for link in all_page_links:
-                        try:
-                            link_text = link.text.strip()
-                            if link_text and len(link_text) > 0:
-                                logger.info(f"  Link: '{link_text}'")
-                        except Exception:
-                            continue
+                    logger.debug("Available links on export page:")
+                    for link_text, _href in self._all_links_js():
+                        if link_text:
+                            logger.debug(f"  Link: '{link_text}'")
 
                     # Also check for any elements containing "Download" or "PSFM"
-                    logger.info("Elements containing 'Download' or 'PSFM':")
+                    logger.debug("Elements containing 'Download' or 'PSFM':")
                     download_elements = self.driver.find_elements(
                         By.XPATH, "//*[contains(text(), 'Download') or contains(text(), 'PSFM')]"
                     )
@@ -974,7 +1549,7 @@ class CollecTFSeleniumDownloader:
                         try:
                             elem_text = elem.text.strip()
                             if elem_text:
-                                logger.info(f"  Element ({elem.tag_name}): '{elem_text}'")
+                                logger.debug(f"  Element ({elem.tag_name}): '{elem_text}'")
                         except Exception:
                             continue
 
@@ -988,6 +1563,78 @@ class CollecTFSeleniumDownloader:
             logger.error(f"Error processing motif report page: {e}")
             return "failed"
 
+    def _sync_http_cookies(self):
+        """Copy the browser's cookies into the HTTP session if the origin has changed"""
+        url = urlsplit(self.driver.current_url)
+        origin = (url.scheme, url.netloc)
+        if origin == self._http_cookie_origin:
+            return
+
+        for cookie in self.driver.get_cookies():
+            self.http.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+        self._http_cookie_origin = origin
+
+    def fetch_psfm_over_http(self, view_link, psfm_link):
+        """Fetch the PSFM behind a download element with the browser's cookies, or None"""
+        try:
+            # Work out the request a click would make, but only where that is certain: a
+            # link's real href, or a named submit control sending its form's fields (including
+            # the csrfmiddlewaretoken). Anything else (table cells, script links) is clicked.
+            request = self.driver.execute_script(
+                """
+                const el = arguments[0];
+                const href = el.tagName === 'A' ? el.getAttribute('href') || '' : '';
+                if (href && !/^(#|javascript:)/i.test(href)) {
+                    return {method: 'GET', url: el.href, data: null};
+                }
+                const isSubmit = ['BUTTON', 'INPUT'].includes(el.tagName) && el.type === 'submit';
+                if (!isSubmit || !el.form || !el.name) return null;
+                const data = [...new FormData(el.form), [el.name, el.value]];
+                const method = el.formMethod || el.form.getAttribute('method') || 'get';
+                return {method: method.toUpperCase(), url: el.formAction, data: data};
+                """,
+                psfm_link,
+            )
+            if not request:
+                return None
+
+            self._sync_http_cookies()
+
+            # Django also checks the referer of POSTs made over HTTPS
+            headers = {"Referer": self.driver.current_url}
+            if request["method"] == "POST":
+                response = self.http.post(
+                    request["url"], data=request["data"], headers=headers, timeout=30
+                )
+            else:
+                response = self.http.get(
+                    request["url"], params=request["data"], headers=headers, timeout=30
+                )
+            response.raise_for_status()
+
+            # PSFMs are exported as raw FASTA; anything else (a web page, a different export)
+            # means the request wasn't what the click sends, so let the click handle it
+            content = response.content
+            if len(content) <= 10 or not content.lstrip().startswith(b">"):
+                logger.info("Direct PSFM request didn't return a PSFM, falling back to clicking")
+                return None
+
+            downloaded_file = (
+                self.download_dir / f"http_TF{view_link['tf_id']}_SP{view_link['species_id']}.txt"
+            )
+            downloaded_file.write_bytes(content)
+            logger.info(f"✓ Fetched PSFM over HTTP ({len(content)} bytes)")
+            return downloaded_file
+
+        except Exception as e:
+            logger.info(f"Could not fetch PSFM over HTTP, falling back to clicking: {e}")
+            return None
+
     def extract_psfm_content_from_page(self, page_source):
         """Extract PSFM content from page source"""
         try:
@@ -995,7 +1642,7 @@ class CollecTFSeleniumDownloader:
             # PSFM content usually starts with ">" (FASTA header) or has tab-separated numbers
 
             # Try to find content between <pre> tags (common for matrix display)
-            pre_match = re.search(r"<pre[^>]*>(.*?)</pre>", page_source, re.DOTALL | re.IGNORECASE)
+            pre_match = PRE_RE.search(page_source)
             if pre_match:
                 content = pre_match.group(1).strip()
                 # Check if it looks like PSFM content
@@ -1006,7 +1653,7 @@ class CollecTFSeleniumDownloader:
                     return content
 
             # Try to find FASTA-like content
-            fasta_match = re.search(r"(>[^\n]+\n(?:[0-9\t\s]+\n?)+)", page_source, re.MULTILINE)
+            fasta_match = FASTA_RE.search(page_source)
             if fasta_match:
                 content = fasta_match.group(1).strip()
                 logger.info("Found FASTA-like PSFM content")
@@ -1019,8 +1666,8 @@ class CollecTFSeleniumDownloader:
             logger.error(f"Error extracting PSFM content: {e}")
             return None
 
-    def save_psfm_content(self, view_link, psfm_content):
-        """Save PSFM content to file"""
+    def save_psfm_content(self, view_link, downloaded_file, method="selenium_browser_automation"):
+        """Move a downloaded PSFM file into the matrices directory"""
         try:
             tf_name = view_link["tf_name"]  # Individual TF name (AdpA, AraC, etc.)
             tf_family = view_link["tf_family"]  # Family name (AraC/XylS)
@@ -1029,12 +1676,16 @@ class CollecTFSeleniumDownloader:
             species_id = view_link["species_id"]
 
             # Generate safe filename components
-            safe_tf_family = re.sub(r"[^\w\-_]", "_", tf_family)
-            safe_tf_name = re.sub(r"[^\w\-_]", "_", tf_name)
-            safe_species_name = re.sub(r"[^\w\-_\s]", "_", species_name).replace(" ", "_")
+            safe_tf_family = SAFE_NAME_RE.sub("_", tf_family)
+            safe_tf_name = SAFE_NAME_RE.sub("_", tf_name)
+            safe_species_name = SAFE_NAME_RE.sub("_", species_name.replace(" ", "_"))
 
-            # Create a hash for uniqueness
-            content_hash = hashlib.md5(psfm_content.encode()).hexdigest()[:8]
+            # Create a hash for uniqueness, streaming the file rather than decoding it
+            hasher = hashlib.blake2b(digest_size=4)
+            with open(downloaded_file, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    hasher.update(chunk)
+            content_hash = hasher.hexdigest()
 
             # Format: Family_IndividualTF_Species_IDs_method_hash.txt
             filename = (
@@ -1042,10 +1693,10 @@ class CollecTFSeleniumDownloader:
                 f"TF{tf_id}_SP{species_id}_selenium_{content_hash}.txt"
             )
 
-            # Save the PSFM
+            # Save the PSFM; the download dir is inside matrices_dir, so this is a rename
             filepath = self.matrices_dir / filename
-            with open(filepath, "w") as f:
-                f.write(psfm_content)
+            content_length = downloaded_file.stat().st_size
+            downloaded_file.replace(filepath)
 
             # Save metadata
             metadata = {
@@ -1056,14 +1707,12 @@ class CollecTFSeleniumDownloader:
                 "species_id": species_id,
                 "filename": filename,
                 "download_timestamp": time.time(),
-                "content_length": len(psfm_content),
-                "method": "selenium_browser_automation",
+                "content_length": content_length,
+                "method": method,
                 "url": self.driver.current_url,
             }
 
-            metadata_file = self.metadata_dir / f"{filename}.json"
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
+            self._metadata_fp.write(_dumps(metadata) + b"\n")
 
             logger.info(f"✓ Downloaded: {tf_name} - {species_name} -> {filename}")
             return "completed"
@@ -1072,7 +1721,7 @@ class CollecTFSeleniumDownloader:
             logger.error(f"Error saving PSFM content: {e}")
             return "failed"
 
-    def download_all_tf_families(self, max_tfs=None):
+    def download_all_tf_families(self, max_tfs=None, workers=1, profile=False):
         """Main function: Download PSFMs using browser automation"""
 
         logger.info("=== CollecTF Selenium PSFM Downloader ===")
@@ -1082,15 +1731,20 @@ class CollecTFSeleniumDownloader:
             # Load progress from previous runs
             completed_tfs, progress_data = self.load_progress()
 
-            # Step 1: Navigate to TF families page
-            if not self.navigate_to_tf_families_page():
-                logger.error("Failed to navigate to TF families page")
-                return 0
-
-            # Step 2: Find and click TF family links
-            successful_downloads = self.find_and_click_tf_family_links(
-                max_tfs, completed_tfs, progress_data
-            )
+            # Steps 1-2: Fetch TF family links and process each family
+            if profile:
+                with cProfile.Profile() as profiler:
+                    successful_downloads = self.find_and_click_tf_family_links(
+                        max_tfs, completed_tfs, progress_data, workers=workers
+                    )
+                profile_file = self.progress_dir / "profile.prof"
+                profiler.dump_stats(profile_file)
+                logger.info(f"Profile written to {profile_file}")
+                logger.info(f"View it with: python -m snakeviz {profile_file}")
+            else:
+                successful_downloads = self.find_and_click_tf_family_links(
+                    max_tfs, completed_tfs, progress_data, workers=workers
+                )
 
             logger.info("\n=== Download Complete ===")
             logger.info(f"Total successful downloads: {successful_downloads}")
@@ -1106,31 +1760,65 @@ class CollecTFSeleniumDownloader:
             # Always close the browser
             self.close()
 
-    def wait_for_download(self, timeout=30):
-        """Wait for a file to be downloaded and return the file path"""
-        import glob
-
+    def wait_for_download(self, timeout=None, ignore=()):
+        """Wait for a new file to be downloaded and return the file path"""
+        if timeout is None:
+            timeout = self.download_timeout
         start_time = time.time()
 
-        while time.time() - start_time < timeout:
-            # Look for any new files in the download directory
-            files = glob.glob(str(self.download_dir / "*"))
+        if self._download_events is not None:
+            # Events for files that were already there or have since been removed are stale
+            while (remaining := start_time + timeout - time.time()) > 0:
+                try:
+                    path = self._download_events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if path not in ignore and Path(path).exists():
+                    return Path(path)
 
-            # Filter out .crdownload files (Chrome partial downloads)
-            complete_files = [f for f in files if not f.endswith(".crdownload")]
+            logger.warning(f"No download completed within {timeout} seconds")
+            return None
+
+        # Without watchdog, poll the directory; only new entries are ever stat'ed
+        while time.time() - start_time < timeout:
+            with os.scandir(self.download_dir) as it:
+                # Filter out .crdownload files (Chrome partial downloads)
+                complete_files = [
+                    entry
+                    for entry in it
+                    if entry.is_file()
+                    and not entry.name.endswith(".crdownload")
+                    and entry.path not in ignore
+                ]
 
             if complete_files:
                 # Return the most recently created file
-                newest_file = max(complete_files, key=lambda f: Path(f).stat().st_mtime)
-                return Path(newest_file)
+                newest_file = max(complete_files, key=lambda entry: entry.stat().st_mtime)
+                return Path(newest_file.path)
 
-            time.sleep(0.5)
+            time.sleep(0.2)
 
         logger.warning(f"No download completed within {timeout} seconds")
         return None
 
     def close(self):
-        """Close the browser"""
+        """Flush pending progress, stop watching downloads and close the browser(s)"""
+        if self._species_executor is not None:
+            # Reports still queued (e.g. after Ctrl-C) are dropped rather than downloaded
+            self._species_executor.shutdown(wait=True, cancel_futures=True)
+            self._species_executor = None
+        self._flush_progress(compact=True)
+        self._metadata_fp.close()
+        for clone in self._species_clones:
+            clone._close_browser()
+        self._species_clones = []
+        self._close_browser()
+
+    def _close_browser(self):
+        """Stop watching downloads and close the browser"""
+        self._stop_download_observer()
+        if self.driver is None:
+            return
         try:
             self.driver.quit()
             logger.info("✓ Browser closed")
@@ -1140,14 +1828,47 @@ class CollecTFSeleniumDownloader:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Download TF family PSFMs from CollecTF")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel browser workers to shard TF families across (default: 1)",
+    )
+    parser.add_argument(
+        "--species-workers",
+        type=int,
+        default=1,
+        help="Number of browsers per worker for downloading motif reports in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--show-browser",
+        action="store_true",
+        help="Run Chrome with a visible window instead of headless",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Profile the crawl with cProfile and write progress/profile.prof "
+            "(view with: python -m snakeviz progress/profile.prof)"
+        ),
+    )
+    args = parser.parse_args()
 
-    # Create downloader (set headless=False to see the browser in action)
-    downloader = CollecTFSeleniumDownloader(headless=False)
+    # Create downloader (use --show-browser to see the browser in action)
+    downloader = CollecTFSeleniumDownloader(
+        headless=not args.show_browser,
+        species_workers=args.species_workers,
+        start_browser=args.workers <= 1,
+    )
 
     try:
         # Download from first 3 TF families for testing
         logger.info("Starting Selenium-based download for ALL TF families...")
-        successful_downloads = downloader.download_all_tf_families()  # Process all TF families
+        successful_downloads = downloader.download_all_tf_families(
+            workers=args.workers, profile=args.profile
+        )  # Process all TF families
 
         if successful_downloads > 0:
             logger.info(